@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+"""
+Build the optional _cfast C extension in place.
+
+Run ``python build.py`` (poetry also runs it when building). cleanmymac_core falls
+back to its pure-Python scanner when the extension is missing, so a failed build
+only prints a note.
+"""
+
+import sys
+import tempfile
+
+from setuptools import Distribution, Extension
+from setuptools.command.build_ext import build_ext
+
+
+def build() -> bool:
+    dist = Distribution({
+        "name": "cleanmymac-python",
+        "ext_modules": [Extension("_cfast", sources=["_cfast.c"])],
+    })
+    cmd = build_ext(dist)
+    cmd.inplace = True
+    with tempfile.TemporaryDirectory() as tmp:
+        cmd.build_temp = cmd.build_lib = tmp
+        try:
+            cmd.ensure_finalized()
+            cmd.run()
+        except Exception as e:
+            print(f"[!] _cfast not built ({e}); using the pure-Python scanner", file=sys.stderr)
+            return False
+    return True
+
+
+if __name__ == "__main__":
+    build()
@@ -41,6 +41,8 @@ def main():
     parser.add_argument("--per-volume-trash", action="store_true", help="Empty /Volumes/*/.Trashes/<uid> and .Trash")
     parser.add_argument("--find-large", action="store_true", help="Find large files")
     parser.add_argument("--min-size", type=int, default=100, help="Minimum size in MB for --find-large (default 100)")
+    parser.add_argument("--one-filesystem", action="store_true",
+                        help="For --find-large, do not descend into other mounted volumes")
     parser.add_argument("--find-old", action="store_true", help="Find old files")
     parser.add_argument("--days", type=int, default=180, help="Age in days for --find-old (default 180)")
     parser.add_argument("--disk-usage", action="store_true", help="Show disk usage")
@@ -53,6 +55,11 @@ def main():
     parser.add_argument("--log", type=Path, help="Log actions to this file")
     parser.add_argument("--limit", type=int, default=20, help="Limit count for large-file listing (default 20)")
     parser.add_argument("--paths", type=Path, nargs="*", help="Optional paths for find operations (default $HOME)")
+    parser.add_argument("--sync", action="store_true",
+                        help="Wait for trash contents to be deleted instead of removing them in the background "
+                             "(the default still walks the whole trash first to report the space freed)")
+    parser.add_argument("--stat-threads", type=int, default=8,
+                        help="Worker threads for directory scans (default 8, 1 = serial)")
 
     args = parser.parse_args()
 
@@ -69,7 +76,8 @@ def main():
     except Exception:
         log_handle = None
 
-    cleaner = CleanMyMac(dry_run=args.dry_run, logger=log_handle)
+    cleaner = CleanMyMac(dry_run=args.dry_run, logger=log_handle, stat_threads=args.stat_threads,
+                         sync_trash=args.sync)
 
     if not any_action:
         print("\n⚠️  WARNING: This tool will delete files. Use at your own risk!")
@@ -144,9 +152,7 @@ def main():
 
             elif choice == '9':
                 print("\n[*] Running all cleaners...")
-                s1 = cleaner.clean_system_caches()
-                s2 = cleaner.clean_trash()
-                s3 = cleaner.clean_logs()
+                s1, s2, s3 = cleaner.clean_all()
                 total_bytes = s1.bytes_freed + s2.bytes_freed + s3.bytes_freed
                 print(f"\n[✓] Total space cleaned: {cleaner.format_size(total_bytes)}")
 
@@ -175,17 +181,21 @@ def main():
     if args.all or args.clean_caches or args.clean_logs or args.clean_trash or args.per_volume_trash:
         confirm_or_exit()
 
-    if args.all or args.clean_caches:
-        stats = cleaner.clean_system_caches()
-        print(f"[✓] Cache cleaned: {cleaner.format_size(stats.bytes_freed)}")
+    if args.all:
+        caches, trash, logs = cleaner.clean_all()
+    else:
+        caches = cleaner.clean_system_caches() if args.clean_caches else None
+        trash = cleaner.clean_trash() if args.clean_trash else None
+        logs = cleaner.clean_logs() if args.clean_logs else None
 
-    if args.all or args.clean_trash:
-        stats = cleaner.clean_trash()
-        print(f"[✓] Trash cleaned: {cleaner.format_size(stats.bytes_freed)}")
+    if caches is not None:
+        print(f"[✓] Cache cleaned: {cleaner.format_size(caches.bytes_freed)}")
 
-    if args.all or args.clean_logs:
-        stats = cleaner.clean_logs()
-        print(f"[✓] Logs cleaned: {cleaner.format_size(stats.bytes_freed)}")
+    if trash is not None:
+        print(f"[✓] Trash cleaned: {cleaner.format_size(trash.bytes_freed)}")
+
+    if logs is not None:
+        print(f"[✓] Logs cleaned: {cleaner.format_size(logs.bytes_freed)}")
 
     if args.per_volume_trash:
         stats = cleaner.clean_per_volume_trash()
@@ -195,7 +205,8 @@ def main():
         roots = args.paths or [cleaner.home]
         for root in roots:
             print(f"\n[*] Searching for files larger than {args.min_size}MB in {root}...")
-            files = cleaner.find_large_files(directory=Path(root), min_size_mb=args.min_size, limit=args.limit)
+            files = cleaner.find_large_files(directory=Path(root), min_size_mb=args.min_size, limit=args.limit,
+                                             one_filesystem=args.one_filesystem)
             if files:
                 print(f"Found {len(files)} large files:\n")
                 for i, (p, s) in enumerate(files, 1):
@@ -7,70 +7,320 @@ Core logic for CleanMyMac Python.
 This module holds the non-UI logic so it can be reused by a CLI or other tools.
 """
 
+import heapq
 import os
 import pwd
 import shutil
-import stat
 import subprocess
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, as_completed, wait
 from dataclasses import dataclass
-from datetime import datetime, timedelta
+from functools import lru_cache
+from itertools import chain
+from operator import itemgetter
 from pathlib import Path
-from typing import Iterable, List, Optional, Tuple
+from typing import Callable, Container, Dict, Iterable, Iterator, List, Optional, Tuple, TypeVar
+
+try:
+    from _cfast import lstat_at as _c_lstat_at
+    from _cfast import sum_tree as _c_sum_tree
+    from _cfast import unlinkat_many as _c_unlinkat_many
+except ImportError:  # extension not built; use the Python implementations
+    _c_lstat_at = None
+    _c_sum_tree = None
+    _c_unlinkat_many = None
+
+T = TypeVar("T")
+
+# Directory names the finders never descend into
+_SKIP_DIRS: frozenset[str] = frozenset({"Library", "System", ".Trash", "node_modules", ".git"})
+
+# Extensions clean_logs removes, matched with one rpartition + set lookup per name
+_LOG_EXTS: frozenset[str] = frozenset({"log", "txt"})
+
+# Finder/Explorer metadata files the finders skip without a stat
+_SKIP_NAMES: frozenset[str] = frozenset({".DS_Store", "Thumbs.db"})
+
+_UNITS = ("B", "KB", "MB", "GB", "TB", "PB")
+
+# Open directories for fd-relative walks without ever following a symlink
+_DIR_FLAGS = os.O_RDONLY | os.O_DIRECTORY | os.O_NOFOLLOW | getattr(os, "O_CLOEXEC", 0)
+# Read-only scans may start from a symlinked root (e.g. --paths ~/link); subdirectories
+# are only queued when scandir reports a real directory
+_SCAN_FLAGS = _DIR_FLAGS & ~os.O_NOFOLLOW
+
+# Hidden directory inside a trash that holds entries awaiting background deletion
+STAGING_PREFIX = ".cmm-stage-"
 
 
 def which(cmd: str) -> Optional[str]:
     return shutil.which(cmd)
 
 
-def is_within(base: Path, target: Path) -> bool:
-    try:
-        base_r = base.resolve()
-        target_r = target.resolve()
-    except FileNotFoundError:
-        # If target disappeared, it's not within; treat as safe noop
-        return False
-    try:
-        target_r.relative_to(base_r)
-        return True
-    except ValueError:
-        return False
+@lru_cache(maxsize=None)
+def gnu_find() -> Optional[str]:
+    """Return a find(1) that supports -printf (GNU findutils, ``gfind`` on macOS), if any."""
+    for name in ("gfind", "find"):
+        path = which(name)
+        if not path:
+            continue
+        try:
+            proc = subprocess.run([path, "--version"], capture_output=True, text=True, timeout=5)
+        except (OSError, subprocess.SubprocessError):
+            continue
+        if proc.returncode == 0 and "GNU" in proc.stdout:
+            return path
+    return None
 
 
-def iter_entries(path: Path) -> Iterable[os.DirEntry]:
+@lru_cache(maxsize=None)
+def find_name_clause(names: frozenset[str]) -> Tuple[str, ...]:
+    """Return ``-name a -o -name b ...`` find(1) arguments for a name set, built once per set."""
+    args: List[str] = []
+    for name in sorted(names):
+        args += ["-o", "-name", name] if args else ["-name", name]
+    return tuple(args)
+
+
+def iter_entries_fd(dir_fd: int) -> Iterable[os.DirEntry]:
+    """Yield the entries of an open directory fd; nothing if it cannot be read.
+
+    The entries' stat() is an fstatat() relative to dir_fd and entry.path is
+    just the name, so follow-up operations should pass dir_fd as well.
+    """
     try:
-        with os.scandir(path) as it:
+        with os.scandir(dir_fd) as it:
             for entry in it:
                 yield entry
     except (PermissionError, FileNotFoundError):
         return
 
 
+def open_dir(path: Path | str) -> Optional[int]:
+    """Open a cleaner root as a directory fd without following a final symlink.
+
+    Returns None when it is missing or unreadable, so callers skip it.
+    """
+    try:
+        return os.open(path, _DIR_FLAGS)
+    except (PermissionError, FileNotFoundError, NotADirectoryError):
+        return None
+
+
+def walk_entries(path: Path | str, include_dirs: bool = False) -> Iterator[os.DirEntry]:
+    """Yield the entries under path, depth-first, without following symlinks.
+
+    Walks with an explicit stack of directory paths instead of nested generators,
+    so only one directory is open at a time and deep trees cannot hit the
+    recursion limit. Non-directory entries are always yielded; directory entries
+    too when include_dirs is set. Sizes can be read from
+    ``entry.stat(follow_symlinks=False)``.
+    """
+    pending = [os.fspath(path)]
+    while pending:
+        dirpath = pending.pop()
+        try:
+            with os.scandir(dirpath) as it:
+                for entry in it:
+                    try:
+                        is_dir = entry.is_dir(follow_symlinks=False)
+                    except OSError:
+                        continue
+                    if not is_dir:
+                        yield entry
+                        continue
+                    if include_dirs:
+                        yield entry
+                    pending.append(entry.path)
+        except OSError:
+            continue
+
+
+def unlinkat_many(dir_fd: int, names: List[str]) -> List[int]:
+    """Unlink each name relative to dir_fd. Returns an errno per name (0 when removed).
+
+    With the _cfast extension the whole batch runs in C without the GIL;
+    otherwise it is a loop of os.unlink(name, dir_fd=...).
+    """
+    if _c_unlinkat_many is not None:
+        return _c_unlinkat_many(dir_fd, names)
+    errs: List[int] = []
+    for name in names:
+        try:
+            os.unlink(name, dir_fd=dir_fd)
+            errs.append(0)
+        except OSError as e:
+            errs.append(e.errno or -1)
+    return errs
+
+
+def scan_dir_batches(path: Path | str, scan_dir: Callable[[str], Tuple[List[T], List[str]]],
+                     workers: int = 8) -> Iterator[List[T]]:
+    """Run scan_dir on path and every subdirectory it reports, yielding its result lists.
+
+    scan_dir lists one directory and returns (results, subdirectory paths to visit).
+    Each directory's non-empty result list is yielded as one batch, so consumers
+    can extend() instead of appending item by item. With workers > 1 directories
+    are scanned on a thread pool, each task handing its subdirectories back to
+    the pool, so stat() calls (which release the GIL) overlap. Batches are
+    yielded on the calling thread.
+    """
+    if workers <= 1:
+        pending = [os.fspath(path)]
+        while pending:
+            found, subdirs = scan_dir(pending.pop())
+            pending.extend(subdirs)
+            if found:
+                yield found
+        return
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        pending = {pool.submit(scan_dir, os.fspath(path))}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for fut in done:
+                found, subdirs = fut.result()
+                pending.update(pool.submit(scan_dir, d) for d in subdirs)
+                if found:
+                    yield found
+
+
+def scan_dirs(path: Path | str, scan_dir: Callable[[str], Tuple[List[T], List[str]]],
+              workers: int = 8) -> Iterator[T]:
+    """Like scan_dir_batches(), but yield the individual results."""
+    return chain.from_iterable(scan_dir_batches(path, scan_dir, workers))
+
+
+def scan_tree_batches(path: Path | str, visit: Callable[[str, str, int, float], Optional[T]],
+                      workers: int = 8, skip_dirs: Container[str] = (),
+                      one_filesystem: bool = False) -> Iterator[List[T]]:
+    """Yield visit(dirpath, name, size, mtime) for every non-directory entry under path.
+
+    Results are grouped per directory: each yielded list holds one directory's
+    non-None visit() results.
+
+    Each directory is opened once and its files are stat'ed relative to that fd
+    (no symlinks followed), so the kernel does not re-resolve full paths and the
+    full path string is only built by visit for the entries it keeps. With the
+    _cfast extension the stat is a statx() asking for just size and mtime;
+    otherwise it is DirEntry.stat(), i.e. fstatat(). Directories are scanned
+    concurrently via scan_dir_batches(). Entries for which visit returns None
+    or whose stat fails are skipped, as are names in _SKIP_NAMES (never
+    stat'ed). With one_filesystem, directories on a different device than path
+    (network or other mounts) are not entered, like ``find -xdev``.
+    """
+    try:
+        root_dev = os.stat(path).st_dev if one_filesystem else None
+    except OSError:
+        return iter(())
+    lstat_at, join = _c_lstat_at, os.path.join
+
+    def scan_dir(dirpath: str) -> Tuple[List[T], List[str]]:
+        found: List[T] = []
+        subdirs: List[str] = []
+        try:
+            fd = os.open(dirpath, _SCAN_FLAGS)
+        except OSError:
+            return found, subdirs
+        try:
+            with os.scandir(fd) as it:
+                for entry in it:
+                    name = entry.name
+                    if name in _SKIP_NAMES:
+                        continue
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            if name not in skip_dirs and (
+                                    root_dev is None or entry.stat(follow_symlinks=False).st_dev == root_dev):
+                                subdirs.append(join(dirpath, name))
+                            continue
+                        if lstat_at is not None:
+                            size, mtime = lstat_at(fd, name)
+                        else:
+                            st = entry.stat(follow_symlinks=False)
+                            size, mtime = st.st_size, st.st_mtime
+                    except OSError:
+                        continue
+                    result = visit(dirpath, name, size, mtime)
+                    if result is not None:
+                        found.append(result)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+        return found, subdirs
+
+    return scan_dir_batches(path, scan_dir, workers)
+
+
 @dataclass
 class CleanStats:
+    """What a cleaner removed. Every cleaner counts each file and each directory
+    it deletes, nested ones included, so totals from different cleaners add up."""
     bytes_freed: int = 0
     files_deleted: int = 0
     dirs_deleted: int = 0
 
 
 class CleanMyMac:
-    def __init__(self, dry_run: bool = False, logger=None):
-        # Prefer the invoking user's home when running under sudo
+    def __init__(self, dry_run: bool = False, logger=None, stat_threads: int = 8, sync_trash: bool = False):
+        # Prefer the invoking user's home when running under sudo. The passwd lookup
+        # is done once here; on macOS it can go through Directory Services.
         sudo_user = os.environ.get("SUDO_USER")
+        self._sudo_user: Optional[str] = None
+        self._target_uid = os.getuid()
+        self.home = Path.home()
         if sudo_user and os.geteuid() == 0:
             try:
-                self.home = Path(pwd.getpwnam(sudo_user).pw_dir)
+                pw = pwd.getpwnam(sudo_user)
             except KeyError:
-                self.home = Path.home()
-        else:
-            self.home = Path.home()
+                pass
+            else:
+                self._sudo_user = sudo_user
+                self._target_uid = pw.pw_uid
+                self.home = Path(pw.pw_dir)
+        self.cache_dir = self.home / "Library" / "Caches"
+        self.log_dir = self.home / "Library" / "Logs"
+        self.trash_dir = self.home / ".Trash"
 
         self.cleaned_size = 0
         self.stats = CleanStats()
+        self._stats_lock = threading.Lock()
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._pool_lock = threading.Lock()
         self.dry_run = dry_run
         self.log = logger
+        self.stat_threads = stat_threads
+        self.sync_trash = sync_trash
+        # (monotonic time, (total, used, free)) of the last get_disk_usage() reading
+        self._du_cache: Optional[Tuple[float, Tuple[int, int, int]]] = None
+        # (st_dev, st_ino) -> (st_mtime_ns, bytes of direct files, subdirectory names)
+        self._dir_size_cache: Dict[Tuple[int, int], Tuple[int, int, List[str]]] = {}
+        # Native rm is only used on POSIX; probe for it once
+        self._rm_bin = which("rm") if os.name == "posix" else None
+        self._dscacheutil = which("dscacheutil")
+        # Set once Finder has emptied all trashes for this instance
+        self._osascript_emptied = False
 
     # ---------- Utilities ----------
 
+    def _get_pool(self) -> ThreadPoolExecutor:
+        """Shared pool for deleting top-level cleaner entries, created on first use."""
+        with self._pool_lock:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(max_workers=min(8, (os.cpu_count() or 1) * 2))
+            return self._pool
+
+    def _record(self, name: str, total: CleanStats) -> None:
+        # Cleaners may run concurrently (see clean_all), so fold results in under a lock
+        with self._stats_lock:
+            self.cleaned_size += total.bytes_freed
+            self.stats.bytes_freed += total.bytes_freed
+            self.stats.files_deleted += total.files_deleted
+            self.stats.dirs_deleted += total.dirs_deleted
+            self._log(f"{name} bytes={total.bytes_freed} files={total.files_deleted} dirs={total.dirs_deleted}")
+
     def _log(self, msg: str) -> None:
         if self.log:
             try:
@@ -79,126 +329,429 @@ class CleanMyMac:
             except Exception:
                 pass
 
-    def format_size(self, bytes_size: int) -> str:
-        size = float(bytes_size)
-        for unit in ["B", "KB", "MB", "GB", "TB"]:
-            if size < 1024.0:
-                return f"{size:.2f} {unit}"
-            size /= 1024.0
-        return f"{size:.2f} PB"
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def format_size(bytes_size: int) -> str:
+        # Memoized: listings repeat many sizes, and the string build dominates
+        # Unit index straight from the bit length: 2**10 per step, capped at PB
+        i = min((int(bytes_size).bit_length() - 1) // 10, len(_UNITS) - 1) if bytes_size > 0 else 0
+        return f"{bytes_size / (1 << (i * 10)):.2f} {_UNITS[i]}"
 
-    def get_dir_size(self, path: Path) -> int:
-        total = 0
-        try:
-            for root, dirs, files in os.walk(path, followlinks=False):
-                for f in files:
-                    fp = Path(root) / f
-                    try:
-                        st = os.stat(fp, follow_symlinks=False)
-                        total += st.st_size
-                    except (OSError, FileNotFoundError):
-                        continue
-        except (PermissionError, FileNotFoundError):
-            pass
-        return total
+    def get_dir_size(self, path: Path | str) -> int:
+        """Total size of the files under path.
 
-    def _safe_delete(self, base: Path, target: Path) -> Tuple[int, int, int]:
-        """Delete target safely without following symlinks. Returns (bytes, files, dirs)."""
-        bytes_freed = files_deleted = dirs_deleted = 0
-        if not is_within(base, target):
-            return 0, 0, 0
+        Each directory's listing is cached under its (dev, inode) and reused while its
+        mtime is unchanged, so repeated measurements (dry runs, re-running cleaners)
+        only stat the directories. Adding, removing or renaming entries bumps the
+        mtime and invalidates that directory; a file rewritten in place does not.
+
+        When the optional _cfast extension is built, the whole walk runs in C
+        (openat/fdopendir/fstatat, GIL released) from a single fd for path instead.
+        If it fails part-way (e.g. out of file descriptors on a very deep tree),
+        the Python scan below, which holds one fd at a time, measures it instead.
+        """
+        if _c_sum_tree is not None:
+            try:
+                fd = os.open(path, _SCAN_FLAGS)
+            except OSError:
+                return 0
+            try:
+                return _c_sum_tree(fd)
+            except OSError:
+                pass
+            finally:
+                os.close(fd)
+        cache = self._dir_size_cache
+        # Bound as closure locals: avoids a global + attribute lookup per directory
+        scandir, join = os.scandir, os.path.join
+
+        def scan_dir(dirpath: str) -> Tuple[List[int], List[str]]:
+            try:
+                fd = os.open(dirpath, _SCAN_FLAGS)
+            except OSError:
+                return [], []
+            try:
+                dst = os.fstat(fd)
+                key = (dst.st_dev, dst.st_ino)
+                cached = cache.get(key)
+                if cached is not None and cached[0] == dst.st_mtime_ns:
+                    return [cached[1]], [join(dirpath, n) for n in cached[2]]
+                size = 0
+                names = []
+                # fd-based scandir: DirEntry.stat() is an fstatat() relative to fd
+                with scandir(fd) as it:
+                    for entry in it:
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                names.append(entry.name)
+                            else:
+                                size += entry.stat(follow_symlinks=False).st_size
+                        except OSError:
+                            continue
+            except OSError:
+                return [], []
+            finally:
+                os.close(fd)
+            cache[key] = (dst.st_mtime_ns, size, names)
+            return [size], [join(dirpath, n) for n in names]
+
+        return sum(scan_dirs(path, scan_dir, self.stat_threads))
+
+    def _safe_delete(self, base: Path, entry: os.DirEntry,
+                     dir_fd: Optional[int] = None) -> Tuple[int, int, int]:
+        """Delete a scandir entry of base without following symlinks. Returns (bytes, files, dirs).
 
+        base must already be resolved (every cleaner resolves its root once). An
+        entry read from base by scandir is inside it by construction, so only
+        symlinks, whose target may lie elsewhere, are resolved and checked; those
+        pointing outside base are left alone. The file/directory decision comes
+        from the entry's cached d_type, so no stat is needed to classify it.
+        Directories are removed (or, in dry runs, counted) by _rmtree_counting()
+        in a single pass that sums sizes as it deletes. dir_fd, when given, is base opened with open_dir(); unlinks and the
+        Python tree removal then go through it instead of the full path.
+        """
+        target = os.path.join(base, entry.name)
+        rel = entry.name if dir_fd is not None else target
         try:
-            st = os.lstat(target)
-        except FileNotFoundError:
-            return 0, 0, 0
-        except PermissionError:
+            if entry.is_symlink():
+                is_dir = False
+                if self._symlink_escapes(base, target):
+                    return 0, 0, 0
+            else:
+                is_dir = entry.is_dir(follow_symlinks=False)
+        except OSError:
             return 0, 0, 0
 
-        # Size accounting: for files/symlinks use st_size; for dirs, compute recursively
-        if stat.S_ISDIR(st.st_mode) and not stat.S_ISLNK(st.st_mode):
-            size_before = self.get_dir_size(target)
-            if self.dry_run:
-                return size_before, 0, 1
+        # Size accounting: for files/symlinks use st_size; for dirs, sum while deleting
+        if is_dir:
+            return self._rmtree_counting(rel, dry_run=self.dry_run, dir_fd=dir_fd)
+        else:
             try:
-                shutil.rmtree(target)
-                return size_before, 0, 1
-            except Exception:
+                size = entry.stat(follow_symlinks=False).st_size
+            except OSError:
                 return 0, 0, 0
-        else:
-            size = st.st_size
             if self.dry_run:
                 return size, 1, 0
             try:
-                os.unlink(target)
+                os.unlink(rel, dir_fd=dir_fd)
                 return size, 1, 0
             except Exception:
                 return 0, 0, 0
 
+    @staticmethod
+    def _symlink_escapes(base: Path, target: str) -> bool:
+        """True when the symlink target (inside resolved base) points outside base."""
+        return not os.path.realpath(target).startswith(os.path.join(base, ""))
+
+    @staticmethod
+    def _rmtree_counting(path: str, dry_run: bool = False, dir_fd: Optional[int] = None) -> Tuple[int, int, int]:
+        """Remove a directory tree in a single scandir pass, summing sizes as it goes.
+
+        Returns (bytes, files, dirs) for what was actually removed, counting
+        every nested file and directory plus path itself; entries that cannot be
+        deleted are left in place and not counted. With dry_run the same pass
+        only counts what would be removed. A relative path is resolved against
+        dir_fd.
+        """
+        try:
+            fd = os.open(path, _DIR_FLAGS, dir_fd=dir_fd)
+        except OSError:
+            return 0, 0, 0
+        try:
+            bytes_freed, files_deleted, dirs_deleted = CleanMyMac._rmtree_fd(fd, dry_run)
+        finally:
+            os.close(fd)
+        if dry_run:
+            return bytes_freed, files_deleted, dirs_deleted + 1
+        try:
+            os.rmdir(path, dir_fd=dir_fd)
+            dirs_deleted += 1
+        except OSError:
+            pass
+        return bytes_freed, files_deleted, dirs_deleted
+
+    @staticmethod
+    def _rmtree_fd(dir_fd: int, dry_run: bool = False) -> Tuple[int, int, int]:
+        """Empty the directory open as dir_fd. Returns (bytes, files, dirs) removed.
+
+        Everything is addressed relative to directory fds (fstatat, unlinkat,
+        openat, rmdir with dir_fd), so the kernel never re-resolves full paths.
+        Each directory is listed completely, its files are removed as one
+        unlinkat_many() batch, and subdirectories are opened with O_NOFOLLOW so a
+        directory swapped for a symlink mid-way is never followed. With dry_run
+        nothing is removed and the totals are what would have been.
+
+        The walk uses an explicit stack and keeps only the current directory
+        open: it goes down by name and back up through "..", checking that ".."
+        is still the (st_dev, st_ino) it came from. Tree depth therefore costs
+        neither recursion nor file descriptors. If a directory is moved away
+        mid-walk the removal stops there. dir_fd itself is left open.
+        """
+        bytes_freed = files_deleted = 0
+        dirs_deleted = 0
+
+        def empty_files(fd: int) -> List[str]:
+            """Remove (or count) the non-directories in fd; return its subdirectory names."""
+            nonlocal bytes_freed, files_deleted
+            names: List[str] = []
+            sizes: List[int] = []
+            subdirs: List[str] = []
+            try:
+                with os.scandir(fd) as it:
+                    for entry in it:
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                subdirs.append(entry.name)
+                            else:
+                                sizes.append(entry.stat(follow_symlinks=False).st_size)
+                                names.append(entry.name)
+                        except OSError:
+                            continue
+            except OSError:
+                return []
+            if dry_run:
+                bytes_freed += sum(sizes)
+                files_deleted += len(names)
+            elif names:
+                for size, err in zip(sizes, unlinkat_many(fd, names)):
+                    if not err:
+                        bytes_freed += size
+                        files_deleted += 1
+            return subdirs
+
+        # One frame per open level: (st_dev, st_ino), name in its parent, subdirectories left
+        st = os.fstat(dir_fd)
+        stack: List[Tuple[Tuple[int, int], str, List[str]]] = [((st.st_dev, st.st_ino), "", empty_files(dir_fd))]
+        fd = dir_fd
+        try:
+            while stack:
+                _, _, pending = stack[-1]
+                if pending:
+                    name = pending.pop()
+                    try:
+                        child = os.open(name, _DIR_FLAGS, dir_fd=fd)
+                    except OSError:
+                        continue
+                    if fd != dir_fd:
+                        os.close(fd)
+                    fd = child
+                    st = os.fstat(fd)
+                    stack.append(((st.st_dev, st.st_ino), name, empty_files(fd)))
+                    continue
+
+                # This directory is done: climb back to its parent and remove it there
+                _, name, _ = stack.pop()
+                if not stack:
+                    break
+                if len(stack) == 1:
+                    parent = dir_fd
+                else:
+                    try:
+                        parent = os.open("..", _DIR_FLAGS, dir_fd=fd)
+                    except OSError:
+                        break
+                    st = os.fstat(parent)
+                    if (st.st_dev, st.st_ino) != stack[-1][0]:
+                        os.close(parent)
+                        break
+                os.close(fd)
+                fd = parent
+                if dry_run:
+                    dirs_deleted += 1
+                    continue
+                try:
+                    os.rmdir(name, dir_fd=fd)
+                    dirs_deleted += 1
+                except OSError:
+                    pass
+        finally:
+            if fd != dir_fd:
+                os.close(fd)
+        return bytes_freed, files_deleted, dirs_deleted
+
+    def _delete_entries(self, base: Path, dir_fd: int, entries: List[os.DirEntry]) -> Tuple[int, int, int]:
+        """_safe_delete() every entry of base on the pool. Returns the summed (bytes, files, dirs).
+
+        Top-level entries are disjoint subtrees, so they can be removed in
+        parallel. Every task has finished with dir_fd when this returns, even
+        if one of them raised, so the caller can close it without a worker
+        touching a closed (or already reused) fd number.
+        """
+        pool = self._get_pool()
+        futures: List[Future] = []
+        try:
+            for entry in entries:
+                futures.append(pool.submit(self._safe_delete, base, entry, dir_fd))
+        finally:
+            wait(futures)
+        bytes_freed = files_deleted = dirs_deleted = 0
+        for future in futures:
+            b, f, d = future.result()
+            bytes_freed += b
+            files_deleted += f
+            dirs_deleted += d
+        return bytes_freed, files_deleted, dirs_deleted
+
+    def _empty_trash_dir(self, base: Path) -> Tuple[int, int, int]:
+        """Empty a trash directory. Returns (bytes, files, dirs).
+
+        Unless sync_trash is set, entries are renamed into a hidden staging
+        directory inside base (O(1) per entry on the same volume) and a detached
+        ``rm -rf`` deletes it, so the trash is empty as soon as this returns.
+        Entries that cannot be moved are deleted in place.
+
+        Each staged directory is still walked first by a dry-run
+        _rmtree_counting(), so the call takes time proportional to the tree and
+        only the deletion itself is deferred. That keeps the totals identical in
+        every mode and to the other cleaners (see CleanStats). Leftover
+        ``STAGING_PREFIX`` directories from earlier runs are removed too but not
+        counted again; symlinks pointing outside base are left alone, as in
+        _safe_delete().
+        """
+        bytes_freed = files_deleted = dirs_deleted = 0
+        dfd = open_dir(base)
+        if dfd is None:
+            return 0, 0, 0
+        staging: Optional[str] = None
+        if not (self.dry_run or self.sync_trash or self._rm_bin is None):
+            staging = f"{STAGING_PREFIX}{os.getpid()}"
+            try:
+                os.mkdir(staging, dir_fd=dfd)
+            except FileExistsError:
+                pass
+            except OSError:
+                staging = None
+
+        try:
+            in_place: List[os.DirEntry] = []
+            # Staging directories left by earlier runs (whose background rm may
+            # still be busy) were already counted then: remove them, uncounted
+            stale: List[os.DirEntry] = []
+            for entry in iter_entries_fd(dfd):
+                name = entry.name
+                if name.startswith(STAGING_PREFIX):
+                    if name == staging:
+                        continue
+                    if staging is not None:
+                        try:
+                            os.rename(name, os.path.join(staging, name), src_dir_fd=dfd, dst_dir_fd=dfd)
+                            continue
+                        except OSError:
+                            pass
+                    stale.append(entry)
+                    continue
+                if staging is not None:
+                    try:
+                        if entry.is_symlink() and self._symlink_escapes(base, os.path.join(base, name)):
+                            continue
+                        if entry.is_dir(follow_symlinks=False):
+                            size, f, d = self._rmtree_counting(name, dry_run=True, dir_fd=dfd)
+                        else:
+                            size, f, d = entry.stat(follow_symlinks=False).st_size, 1, 0
+                        os.rename(name, os.path.join(staging, name), src_dir_fd=dfd, dst_dir_fd=dfd)
+                    except OSError:
+                        # e.g. a mount point or an entry we may not move: delete in place
+                        pass
+                    else:
+                        bytes_freed += size
+                        files_deleted += f
+                        dirs_deleted += d
+                        continue
+                in_place.append(entry)
+
+            self._delete_entries(base, dfd, stale)
+            b, f, d = self._delete_entries(base, dfd, in_place)
+            bytes_freed += b
+            files_deleted += f
+            dirs_deleted += d
+        finally:
+            os.close(dfd)
+
+        if staging is not None:
+            staging_path = os.path.join(base, staging)
+            try:
+                subprocess.Popen([self._rm_bin, "-rf", "--", staging_path],
+                                 stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL,
+                                 stderr=subprocess.DEVNULL, start_new_session=True)
+            except OSError:
+                self._rmtree_counting(staging_path)
+        return bytes_freed, files_deleted, dirs_deleted
+
+    def _finder_empty_trash(self) -> bool:
+        """Ask Finder to empty the trash via osascript. Returns True on success.
+
+        Finder empties every trash (home and all volumes) at once, so after one
+        successful run later fallbacks on this instance skip the process spawn.
+        """
+        if self._osascript_emptied:
+            return True
+        try:
+            subprocess.run([
+                "osascript",
+                "-e",
+                'tell application "Finder" to empty trash',
+            ], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True)
+        except (subprocess.CalledProcessError, FileNotFoundError):
+            return False
+        self._osascript_emptied = True
+        return True
+
     # ---------- Cleaners ----------
 
     def clean_system_caches(self) -> CleanStats:
-        cache_dirs: List[Path] = [self.home / "Library" / "Caches"]
+        cache_dirs: List[Path] = [self.cache_dir]
         total = CleanStats()
         for cache_dir in cache_dirs:
-            if not cache_dir.exists():
+            # resolve(strict=True) doubles as the existence check; like exists(),
+            # any OSError (missing, not a directory, unreadable, loop) skips the root
+            try:
+                base = cache_dir.resolve(strict=True)
+            except OSError:
+                continue
+            # Entries are removed relative to one long-lived fd for the root
+            dfd = open_dir(base)
+            if dfd is None:
                 continue
-            base = cache_dir.resolve()
-            for entry in iter_entries(base):
-                target = base / entry.name
-                b, f, d = self._safe_delete(base, target)
+            try:
+                b, f, d = self._delete_entries(base, dfd, list(iter_entries_fd(dfd)))
                 total.bytes_freed += b
                 total.files_deleted += f
                 total.dirs_deleted += d
-        self.cleaned_size += total.bytes_freed
-        self.stats.bytes_freed += total.bytes_freed
-        self.stats.files_deleted += total.files_deleted
-        self.stats.dirs_deleted += total.dirs_deleted
-        self._log(f"clean_caches bytes={total.bytes_freed} files={total.files_deleted} dirs={total.dirs_deleted}")
+            finally:
+                os.close(dfd)
+        self._record("clean_caches", total)
         return total
 
     def clean_trash(self) -> CleanStats:
-        trash = self.home / ".Trash"
+        trash = self.trash_dir
         total = CleanStats()
-        if not trash.exists():
+        try:
+            base = trash.resolve(strict=True)
+        except OSError:
             return total
-        base = trash.resolve()
         try:
-            for entry in iter_entries(base):
-                target = base / entry.name
-                b, f, d = self._safe_delete(base, target)
-                total.bytes_freed += b
-                total.files_deleted += f
-                total.dirs_deleted += d
+            b, f, d = self._empty_trash_dir(base)
+            total.bytes_freed += b
+            total.files_deleted += f
+            total.dirs_deleted += d
         except PermissionError:
             # Fallback 1: AppleScript (Finder)
-            try:
-                subprocess.run([
-                    "osascript",
-                    "-e",
-                    'tell application "Finder" to empty trash',
-                ], check=True)
+            if self._finder_empty_trash():
                 # We cannot know bytes freed without enumerating; keep zeroed but not an error
                 return total
-            except (subprocess.CalledProcessError, FileNotFoundError):
-                # Fallback 2: try as invoking user without shell
-                if os.geteuid() == 0 and (sudo_user := os.environ.get("SUDO_USER")):
-                    try:
-                        user_home = Path(pwd.getpwnam(sudo_user).pw_dir)
-                        user_trash = str((user_home / ".Trash").resolve())
-                        find_bin = which("find") or "/usr/bin/find"
-                        subprocess.run([
-                            "sudo", "-u", sudo_user,
-                            find_bin, user_trash, "-mindepth", "1", "-maxdepth", "1", "-delete"
-                        ], check=True)
-                        return total
-                    except (subprocess.CalledProcessError, KeyError, FileNotFoundError):
-                        return total
-        self.cleaned_size += total.bytes_freed
-        self.stats.bytes_freed += total.bytes_freed
-        self.stats.files_deleted += total.files_deleted
-        self.stats.dirs_deleted += total.dirs_deleted
-        self._log(f"clean_trash bytes={total.bytes_freed} files={total.files_deleted} dirs={total.dirs_deleted}")
+            # Fallback 2: try as invoking user without shell
+            if self._sudo_user:
+                try:
+                    user_trash = str(base)
+                    find_bin = which("find") or "/usr/bin/find"
+                    subprocess.run([
+                        "sudo", "-u", self._sudo_user,
+                        find_bin, user_trash, "-mindepth", "1", "-maxdepth", "1", "-delete"
+                    ], check=True)
+                    return total
+                except (subprocess.CalledProcessError, FileNotFoundError):
+                    return total
+        self._record("clean_trash", total)
         return total
 
     def clean_per_volume_trash(self) -> CleanStats:
@@ -206,127 +759,301 @@ class CleanMyMac:
         total = CleanStats()
         if not volumes_root.is_dir():
             return total
-        # Determine target UID
-        try:
-            if os.geteuid() == 0 and os.environ.get("SUDO_USER"):
-                uid = pwd.getpwnam(os.environ["SUDO_USER"]).pw_uid
-            else:
-                uid = os.getuid()
-        except KeyError:
-            uid = os.getuid()
-
+        uid = self._target_uid
         had_perm_issue = False
         for vol in volumes_root.iterdir():
             if not vol.is_dir():
                 continue
             candidates = [vol / ".Trashes" / str(uid), vol / ".Trash"]
             for c in candidates:
-                if not c.exists():
+                try:
+                    base = c.resolve(strict=True)
+                except PermissionError:
+                    # e.g. a volume root we may not search
+                    had_perm_issue = True
+                    continue
+                except OSError:
                     continue
-                base = c.resolve()
                 try:
-                    for entry in iter_entries(base):
-                        target = base / entry.name
-                        b, f, d = self._safe_delete(base, target)
-                        total.bytes_freed += b
-                        total.files_deleted += f
-                        total.dirs_deleted += d
+                    b, f, d = self._empty_trash_dir(base)
+                    total.bytes_freed += b
+                    total.files_deleted += f
+                    total.dirs_deleted += d
                 except PermissionError:
                     had_perm_issue = True
         if had_perm_issue:
             # Finder fallback empties all trashes
-            try:
-                subprocess.run([
-                    "osascript",
-                    "-e",
-                    'tell application "Finder" to empty trash',
-                ], check=True)
-            except (subprocess.CalledProcessError, FileNotFoundError):
-                pass
-        self.cleaned_size += total.bytes_freed
-        self.stats.bytes_freed += total.bytes_freed
-        self.stats.files_deleted += total.files_deleted
-        self.stats.dirs_deleted += total.dirs_deleted
-        self._log(f"clean_per_volume_trash bytes={total.bytes_freed} files={total.files_deleted} dirs={total.dirs_deleted}")
+            self._finder_empty_trash()
+        self._record("clean_per_volume_trash", total)
         return total
 
     def clean_logs(self) -> CleanStats:
-        log_dir = self.home / "Library" / "Logs"
+        log_dir = self.log_dir
         total = CleanStats()
-        if not log_dir.exists():
+        try:
+            base = log_dir.resolve(strict=True)
+        except OSError:
             return total
-        base = log_dir.resolve()
-        for root, dirs, files in os.walk(base):
-            for file in files:
-                if file.endswith(".log") or file.endswith(".txt"):
-                    fp = Path(root) / file
-                    b, f, d = self._safe_delete(base, fp)
-                    total.bytes_freed += b
-                    total.files_deleted += f
-                    total.dirs_deleted += d
-        self.cleaned_size += total.bytes_freed
-        self.stats.bytes_freed += total.bytes_freed
-        self.stats.files_deleted += total.files_deleted
-        self.stats.dirs_deleted += total.dirs_deleted
-        self._log(f"clean_logs bytes={total.bytes_freed} files={total.files_deleted} dirs={total.dirs_deleted}")
+        # Unlink relative to an open directory fd (unlinkat) so the kernel does not
+        # re-walk the full path per file. O_NOFOLLOW keeps the walk inside base.
+        scandir, unlink, join = os.scandir, os.unlink, os.path.join
+        dry_run = self.dry_run
+        pending = [os.fspath(base)]
+        while pending:
+            dirpath = pending.pop()
+            try:
+                fd = os.open(dirpath, _DIR_FLAGS)
+            except OSError:
+                continue
+            try:
+                with scandir(fd) as it:
+                    for entry in it:
+                        name = entry.name
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                pending.append(join(dirpath, name))
+                                continue
+                            _, dot, ext = name.rpartition(".")
+                            if dot and ext in _LOG_EXTS:
+                                size = entry.stat(follow_symlinks=False).st_size
+                                if not dry_run:
+                                    unlink(name, dir_fd=fd)
+                                total.bytes_freed += size
+                                total.files_deleted += 1
+                        except OSError:
+                            continue
+            except OSError:
+                pass
+            finally:
+                os.close(fd)
+        self._record("clean_logs", total)
         return total
 
+    def clean_all(self) -> Tuple[CleanStats, CleanStats, CleanStats]:
+        """Run the cache, trash and log cleaners concurrently.
+
+        They touch separate directories and spend their time in syscalls, so the
+        total is close to the slowest of the three. Returns (caches, trash, logs).
+        """
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            caches = pool.submit(self.clean_system_caches)
+            trash = pool.submit(self.clean_trash)
+            logs = pool.submit(self.clean_logs)
+            return caches.result(), trash.result(), logs.result()
+
     # ---------- Information ----------
 
     def find_large_files(self, directory: Optional[Path] = None, min_size_mb: int = 100,
-                          limit: int = 20, paths_only: bool = False) -> List[Tuple[Path, int]]:
+                          limit: int = 20, paths_only: bool = False,
+                          one_filesystem: bool = False) -> List[Tuple[Path, int]]:
         if directory is None:
             directory = self.home
         min_size = min_size_mb * 1024 * 1024
-        results: List[Tuple[Path, int]] = []
+        # Smallest size that can still make the result; raised to the heap's minimum
+        # once limit matches are held so the scan stops building paths for the rest
+        floor = [min_size]
+        batches = self._iter_large_batches(directory, min_size, one_filesystem, floor)
+        # Candidates carry str paths; Path objects are only built for the results.
+        # A zero or negative limit means no limit.
+        if limit <= 0:
+            matches: List[Tuple[str, int]] = []
+            for batch in batches:
+                matches.extend(batch)
+            matches.sort(key=itemgetter(1), reverse=True)
+            return [(Path(fp), size) for fp, size in matches]
+        # Size-limit min-heap; -order keeps the earliest match first among equal sizes
+        heap: List[Tuple[int, int, str]] = []
+        order = 0
+        for batch in batches:
+            if len(heap) == limit:
+                # Drop what cannot beat the current minimum in one pass over the batch
+                low = heap[0][0]
+                batch = [c for c in batch if c[1] > low]
+            for fp, size in batch:
+                order -= 1
+                if len(heap) < limit:
+                    heapq.heappush(heap, (size, order, fp))
+                    if len(heap) == limit:
+                        floor[0] = heap[0][0]
+                elif size > heap[0][0]:
+                    heapq.heapreplace(heap, (size, order, fp))
+                    floor[0] = heap[0][0]
+        return [(Path(fp), size) for size, _, fp in sorted(heap, reverse=True)]
+
+    def _iter_large_batches(self, directory: Path, min_size: int, one_filesystem: bool = False,
+                            floor: Optional[List[int]] = None) -> Iterator[List[Tuple[str, int]]]:
+        """Yield lists of (path, size) for files larger than min_size, as they are found.
+
+        Each list is one directory, one find(1) subtree or one chunk of find's
+        output; paths are plain strings. floor, when given, is a one-element list the
+        consumer may raise while iterating; files not larger than floor[0] are
+        then dropped before their path is even joined.
+        """
+        if floor is None:
+            floor = [min_size]
+        join = os.path.join
+
+        def visit(dirpath: str, name: str, size: int, mtime: float) -> Optional[Tuple[str, int]]:
+            return (join(dirpath, name), size) if size > floor[0] else None
+
+        matches = self._find_large_parallel(directory, min_size, one_filesystem, floor, visit)
+        if matches is not None:
+            return matches
+        return scan_tree_batches(directory, visit, self.stat_threads, _SKIP_DIRS, one_filesystem)
+
+    def _find_large_parallel(self, directory: Path, min_size: int, one_filesystem: bool, floor: List[int],
+                             visit: Callable[[str, str, int, float], Optional[Tuple[str, int]]]
+                             ) -> Optional[Iterator[List[Tuple[str, int]]]]:
+        """Run one find(1) per top-level subdirectory, up to stat_threads at once.
+
+        A single find walks the tree serially, so on high-latency disks (external
+        volumes, network homes) it mostly waits on I/O; separate subtrees overlap
+        that waiting. Each worker drops files at or below the shared floor, and
+        the caller's heap merges what is left. Files directly in directory are
+        stat'ed here. A subtree whose find cannot be started (e.g. EAGAIN or
+        EMFILE) is scanned in Python with visit instead. Returns None when GNU
+        find is unavailable; the Python scan is already parallel per directory.
+        """
+        if not gnu_find():
+            return None
+        top: List[Tuple[str, int]] = []
+        subroots: List[str] = []
         try:
-            for root, dirs, files in os.walk(directory):
-                base = Path(root)
-                # Skip system directories under home
-                dirs[:] = [d for d in dirs if d not in ["Library", "System", ".Trash"]]
-                for name in files:
-                    fp = base / name
-                    try:
-                        st = os.stat(fp, follow_symlinks=False)
-                        if st.st_size > min_size:
-                            results.append((fp, st.st_size))
-                    except (OSError, FileNotFoundError, PermissionError):
-                        continue
-        except (PermissionError, FileNotFoundError):
-            pass
-        results.sort(key=lambda x: x[1], reverse=True)
-        return results[:limit] if limit else results
+            root_dev = os.stat(directory).st_dev
+            with os.scandir(directory) as it:
+                entries = list(it)
+        except OSError:
+            return iter(())
+        for entry in entries:
+            name = entry.name
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    # Skip system directories under home
+                    if name not in _SKIP_DIRS and (
+                            not one_filesystem or entry.stat(follow_symlinks=False).st_dev == root_dev):
+                        subroots.append(entry.path)
+                elif name not in _SKIP_NAMES and entry.is_file(follow_symlinks=False):
+                    size = entry.stat(follow_symlinks=False).st_size
+                    if size > min_size:
+                        top.append((entry.path, size))
+            except OSError:
+                continue
+
+        def scan(subroot: str) -> List[Tuple[str, int]]:
+            batches = self._find_large_native(subroot, min_size, _SKIP_DIRS, one_filesystem, floor)
+            if batches is None:
+                # Already one of up to stat_threads workers: scan this subtree serially
+                batches = scan_tree_batches(subroot, visit, 1, _SKIP_DIRS, one_filesystem)
+            found: List[Tuple[str, int]] = []
+            for batch in batches:
+                found.extend(batch)
+            return found
+
+        def results() -> Iterator[List[Tuple[str, int]]]:
+            if top:
+                yield top
+            if not subroots:
+                return
+            if self.stat_threads <= 1:
+                for subroot in subroots:
+                    found = scan(subroot)
+                    if found:
+                        yield found
+                return
+            with ThreadPoolExecutor(max_workers=min(self.stat_threads, len(subroots))) as pool:
+                for future in as_completed([pool.submit(scan, r) for r in subroots]):
+                    found = future.result()
+                    if found:
+                        yield found
+
+        return results()
+
+    @staticmethod
+    def _find_large_native(directory: Path, min_size: int, skip_dirs: frozenset[str],
+                           one_filesystem: bool = False,
+                           floor: Optional[List[int]] = None) -> Optional[Iterator[List[Tuple[str, int]]]]:
+        """Filter by size inside GNU find(1) so Python only sees the matches.
+
+        Records are parsed from find's output while it is still running and
+        yielded one list per chunk read.
+        Returns None when no suitable find is available so the caller can scan in Python.
+        """
+        find_bin = gnu_find()
+        if not find_bin:
+            return None
+        root = os.fspath(directory)
+        if root.startswith("-"):
+            root = os.path.join(".", root)
+        cmd = [find_bin, root, *(["-xdev"] if one_filesystem else []), "-mindepth", "1",
+               "(", "-type", "d", "(", *find_name_clause(skip_dirs), ")", "-prune", ")", "-o",
+               "-type", "f", "!", "(", *find_name_clause(_SKIP_NAMES), ")",
+               "-size", f"+{min_size}c", "-printf", "%s %p\\0"]
+        try:
+            # Unreadable subdirectories make find exit non-zero; its output is still valid
+            proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+        except OSError:
+            return None
+        if floor is None:
+            floor = [min_size]
+
+        def records() -> Iterator[List[Tuple[str, int]]]:
+            read, tail = proc.stdout.read1, b""
+            try:
+                while chunk := read(1 << 16):
+                    batch = (tail + chunk).split(b"\0")
+                    tail = batch.pop()
+                    found: List[Tuple[str, int]] = []
+                    low = floor[0]
+                    for record in batch:
+                        size, sep, path = record.partition(b" ")
+                        if sep and int(size) > low:
+                            found.append((os.fsdecode(path), int(size)))
+                    if found:
+                        yield found
+                proc.wait()
+            finally:
+                # Consumer stopped early: don't leave find running
+                if proc.poll() is None:
+                    proc.kill()
+                    proc.wait()
+                proc.stdout.close()
+
+        return records()
 
     def find_old_files(self, directory: Optional[Path] = None, days_old: int = 180,
-                        skip_system: bool = True) -> List[Tuple[Path, int, datetime]]:
+                        skip_system: bool = True) -> List[Tuple[Path, int, float]]:
+        """Return (path, size, mtime) for files not modified in days_old days.
+
+        mtime is the raw st_mtime timestamp; callers that display it convert the
+        few entries they print with datetime.fromtimestamp(). Use _iter_old_batches()
+        to consume matches (with str paths) without holding them all.
+        """
         if directory is None:
             directory = self.home
-        cutoff = datetime.now() - timedelta(days=days_old)
-        results: List[Tuple[Path, int, datetime]] = []
-        try:
-            for root, dirs, files in os.walk(directory):
-                if skip_system:
-                    dirs[:] = [d for d in dirs if d not in ["Library", "System", ".Trash"]]
-                base = Path(root)
-                for name in files:
-                    fp = base / name
-                    try:
-                        st = os.stat(fp, follow_symlinks=False)
-                        mtime = datetime.fromtimestamp(st.st_mtime)
-                        if mtime < cutoff:
-                            results.append((fp, st.st_size, mtime))
-                    except (OSError, FileNotFoundError, PermissionError):
-                        continue
-        except (PermissionError, FileNotFoundError):
-            pass
+        results: List[Tuple[Path, int, float]] = []
+        for batch in self._iter_old_batches(directory, days_old, skip_system):
+            results.extend([(Path(fp), size, mtime) for fp, size, mtime in batch])
         return results
 
+    def _iter_old_batches(self, directory: Path, days_old: int,
+                          skip_system: bool = True) -> Iterator[List[Tuple[str, int, float]]]:
+        """Yield per-directory lists of (path, size, mtime) for files older than days_old."""
+        cutoff = time.time() - days_old * 86400
+        join = os.path.join
+
+        def visit(dirpath: str, name: str, size: int, mtime: float) -> Optional[Tuple[str, int, float]]:
+            return (join(dirpath, name), size, mtime) if mtime < cutoff else None
+
+        skip_dirs = _SKIP_DIRS if skip_system else ()
+        return scan_tree_batches(directory, visit, self.stat_threads, skip_dirs)
+
     def free_memory(self) -> bool:
         purge = which("purge")
         if not purge:
             return False
         try:
-            result = subprocess.run([purge], capture_output=True, text=True)
+            # Only the exit status matters; no pipes to allocate and drain
+            result = subprocess.run([purge], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
             return result.returncode == 0
         except PermissionError:
             return False
@@ -335,13 +1062,25 @@ class CleanMyMac:
         # Requires root for killall HUP mDNSResponder
         if os.geteuid() != 0:
             return False
+        if not self._dscacheutil:
+            return False
         try:
-            subprocess.run(["dscacheutil", "-flushcache"], check=True)
-            subprocess.run(["killall", "-HUP", "mDNSResponder"], check=True)
+            # One shell child runs both steps instead of two separate fork+execs
+            subprocess.run(["/bin/sh", "-c", "dscacheutil -flushcache && killall -HUP mDNSResponder"],
+                           stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True)
             return True
         except (subprocess.CalledProcessError, FileNotFoundError):
             return False
 
     def get_disk_usage(self) -> Tuple[int, int, int]:
-        statv = shutil.disk_usage(self.home)
-        return statv.total, statv.used, statv.free
+        # Rapid repeats (e.g. menu option 8 pressed twice) reuse the last reading for a second
+        now = time.monotonic()
+        if self._du_cache is not None and now - self._du_cache[0] < 1.0:
+            return self._du_cache[1]
+        st = os.statvfs(self.home)
+        # Same figures as shutil.disk_usage without its extra wrapper
+        total = st.f_blocks * st.f_frsize
+        used = (st.f_blocks - st.f_bfree) * st.f_frsize
+        free = st.f_bavail * st.f_frsize
+        self._du_cache = (now, (total, used, free))
+        return total, used, free
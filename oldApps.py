@@ -1,8 +1,11 @@
 #!/usr/bin/env python3
 import os
+import re
 import shutil
 from pathlib import Path
 
+from cleanmymac_core import walk_entries
+
 # Common macOS directories where apps store leftover files
 SEARCH_PATHS = [
     "~/Library/Application Support",
@@ -18,14 +21,15 @@ SEARCH_PATHS = [
 
 def find_leftovers(app_name: str):
     leftovers = []
+    # One case-insensitive regex scan per name instead of lower()-ing every entry
+    search = re.compile(re.escape(app_name), re.IGNORECASE).search
     for base_path in SEARCH_PATHS:
         path = Path(os.path.expanduser(base_path))
         if not path.exists():
             continue
-        for root, dirs, files in os.walk(path):
-            for name in dirs + files:
-                if app_name.lower() in name.lower():
-                    leftovers.append(Path(root) / name)
+        for entry in walk_entries(path, include_dirs=True):
+            if search(entry.name):
+                leftovers.append(Path(entry.path))
     return leftovers
 
 def delete_leftovers(leftovers):